@@ -7,6 +7,7 @@ from routes.admin import admin_bp   # імпортуємо адмінку
 from flasgger import Swagger
 from routes.shop import shop_bp
 from routes import api_bp
+from inventory import start_reservation_sweeper
 from dotenv import load_dotenv
 from sqlalchemy import text
 
@@ -19,6 +20,12 @@ os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
 app = Flask(__name__)
 app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{DATABASE_PATH}'
 app.config['SECRET_KEY'] = os.environ.get("SECRET_KEY", "your_secret_key")
+# Під час розпродажів багато checkout'ів пишуть одночасно — чекаємо на блокування sqlite, а не падаємо
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {"connect_args": {"timeout": 15}}
+# Скільки секунд товар зарезервований за кошиком
+app.config['RESERVATION_TTL'] = int(os.environ.get("RESERVATION_TTL", 600))
+# Залишок, який один раз отримують товари наявної БД при додаванні колонки stock
+app.config['INITIAL_STOCK'] = int(os.environ.get("INITIAL_STOCK", 50))
 
 swagger = Swagger(app)
 db.init_app(app)
@@ -84,12 +91,18 @@ with app.app_context():
             if column_name not in cols:
                 db.session.execute(text(f"ALTER TABLE {table} ADD COLUMN {col_def};"))
                 db.session.commit()
+                return True
         except Exception:
             db.session.rollback()
+        return False
 
     # гарантуємо наявність потрібних колонок
     _ensure_column("product", "description", "description TEXT")
     _ensure_column("feedback", "product_id", "product_id INTEGER")
+    if _ensure_column("product", "stock", "stock INTEGER NOT NULL DEFAULT 0"):
+        # разове заповнення: інакше всі наявні товари одразу стали б "немає в наявності"
+        db.session.execute(text("UPDATE product SET stock = :stock;"), {"stock": app.config['INITIAL_STOCK']})
+        db.session.commit()
 
 # Обробка помилок
 @app.errorhandler(404)
@@ -204,8 +217,15 @@ if __name__ == "__main__":
                 Product(name="Watermelon & Melon", price=265, image_url="images/watermelon_melon.jpg",
                         description="Соковита диня з кавуном — легкий, солодкий та дуже літній смак.")
             ]
+            for p in demo_products:
+                p.stock = app.config['INITIAL_STOCK']
             db.session.add_all(demo_products)
             db.session.commit()
             print("✅ База заповнена демо‑товарами")
+    # Фоновий потік, що повертає на склад прострочені резерви.
+    # З debug=True цей блок виконується і в батьківському процесі reloader'а — запускаємо лише в дочірньому.
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_reservation_sweeper(app, interval=int(os.environ.get("RESERVATION_SWEEP_INTERVAL", 60)))
+
     # Запускаємо Flask на всіх інтерфейсах щоб він був доступний з хоста контейнера
     app.run(host="0.0.0.0", port=5000, debug=True)
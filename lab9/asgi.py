@@ -0,0 +1,103 @@
+import os
+from contextlib import asynccontextmanager
+from dotenv import load_dotenv
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from models import Product, Feedback, Order
+
+# Асинхронний шар лише для читання публічного JSON API.
+# Flask (app.py) і далі обслуговує HTML-сторінки та всі записи,
+# а тут ті самі моделі з models.py читаються через aiosqlite.
+# Запуск: uvicorn asgi:app --host 0.0.0.0 --port 8000
+
+load_dotenv()
+
+DATABASE_PATH = os.environ.get("DATABASE_PATH", "data/database.db")
+
+# Обмежений пул з'єднань: зайві запити чекають у черзі, а не відкривають нові з'єднання.
+# Для файлової sqlite діалект aiosqlite за замовчуванням бере NullPool, тому пул задаємо явно.
+engine = create_async_engine(
+    f"sqlite+aiosqlite:///{DATABASE_PATH}",
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=int(os.environ.get("ASYNC_POOL_SIZE", 10)),
+    max_overflow=0,
+    pool_timeout=30,
+    connect_args={"timeout": 15},
+)
+Session = async_sessionmaker(engine, expire_on_commit=False)
+
+
+# 🔹 Продукти (той самий формат, що й /api/products у Flask)
+async def api_products(request):
+    async with Session() as session:
+        products = (await session.execute(select(Product))).scalars().all()
+    return JSONResponse({
+        "products": [
+            {
+                "id": p.id,
+                "name": p.name,
+                "price": p.price,
+                "image_url": p.image_url,
+                "stock": p.stock
+            } for p in products
+        ]
+    })
+
+
+# 🔹 Відгуки
+async def api_feedback(request):
+    async with Session() as session:
+        feedback = (await session.execute(select(Feedback))).scalars().all()
+    return JSONResponse([{
+        "id": f.id,
+        "name": f.name,
+        "email": f.email,
+        "message": f.message,
+        "product_id": f.product_id
+    } for f in feedback])
+
+
+# 🔹 Статус замовлення
+async def api_order_status(request):
+    order_id = request.path_params["order_id"]
+    async with Session() as session:
+        order = await session.get(Order, order_id)
+    if not order:
+        return JSONResponse({"error": "Not Found"}, status_code=404)
+    return JSONResponse({
+        "id": order.id,
+        "status": order.status,
+        "total_price": order.total_price,
+        "date": order.date
+    })
+
+
+# Healthcheck
+async def health(request):
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return JSONResponse({"status": "healthy"})
+    except Exception as e:
+        return JSONResponse({"status": "unhealthy", "error": str(e)}, status_code=500)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    await engine.dispose()
+
+
+app = Starlette(
+    routes=[
+        Route("/api/products", api_products),
+        Route("/api/feedback", api_feedback),
+        Route("/api/orders/{order_id:int}", api_order_status),
+        Route("/health", health),
+    ],
+    lifespan=lifespan,
+)
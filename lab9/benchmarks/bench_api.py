@@ -0,0 +1,77 @@
+"""
+Навантажувальний тест JSON API: N одночасних клієнтів з keep-alive з'єднаннями.
+
+Кожен клієнт відкриває власне постійне з'єднання і послідовно робить REQUESTS запитів,
+тож одночасно "висить" CLIENTS з'єднань — як багато мобільних клієнтів, що опитують API.
+
+Запуск (потрібен httpx: pip install httpx):
+    python app.py                                  # Flask, порт 5000
+    uvicorn asgi:app --port 8000                   # ASGI, порт 8000
+    python benchmarks/bench_api.py http://localhost:5000
+    python benchmarks/bench_api.py http://localhost:8000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def run_client(base_url, path, requests, timeout, latencies, errors):
+    # окремий AsyncClient = окреме постійне з'єднання на клієнта
+    limits = httpx.Limits(max_connections=1, max_keepalive_connections=1)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+        for _ in range(requests):
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                errors.append(type(e).__name__)
+                continue
+            latencies.append(time.perf_counter() - started)
+
+
+async def bench(base_url, path, clients, requests, timeout):
+    latencies, errors = [], []
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        run_client(base_url, path, requests, timeout, latencies, errors) for _ in range(clients)
+    ))
+    elapsed = time.perf_counter() - started
+    return latencies, errors, elapsed
+
+
+def percentile(values, p):
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(int(len(values) * p / 100), len(values) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк JSON API з keep-alive клієнтами")
+    parser.add_argument("base_url", help="наприклад http://localhost:5000")
+    parser.add_argument("--path", default="/api/products")
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=10, help="запитів на одного клієнта")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    latencies, errors, elapsed = asyncio.run(
+        bench(args.base_url, args.path, args.clients, args.requests, args.timeout)
+    )
+
+    print(f"{args.base_url}{args.path}: {args.clients} клієнтів x {args.requests} запитів")
+    print(f"  успішних: {len(latencies)}, помилок: {len(errors)}"
+          + (f" ({', '.join(sorted(set(errors)))})" if errors else ""))
+    print(f"  час: {elapsed:.2f} с, пропускна здатність: {len(latencies) / elapsed:.0f} req/s")
+    if latencies:
+        print(f"  затримка: p50 {percentile(latencies, 50) * 1000:.0f} мс, "
+              f"p99 {percentile(latencies, 99) * 1000:.0f} мс, "
+              f"середня {statistics.mean(latencies) * 1000:.0f} мс")
+
+
+if __name__ == "__main__":
+    main()
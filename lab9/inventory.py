@@ -0,0 +1,124 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import case, func, literal, select, update
+from sqlalchemy.dialects.sqlite import insert
+from models import db, Product, StockReservation
+
+# Скільки секунд товар "тримається" за кошиком, поки клієнт не оформить замовлення
+DEFAULT_RESERVATION_TTL = 600
+
+
+def _ttl():
+    return current_app.config.get("RESERVATION_TTL", DEFAULT_RESERVATION_TTL)
+
+
+def _reserved_by_others(cart_token, now):
+    """Скільки одиниць товару тримають активні резерви інших кошиків (корельований підзапит)."""
+    return (
+        select(func.coalesce(func.sum(StockReservation.quantity), 0))
+        .where(
+            StockReservation.product_id == Product.id,
+            StockReservation.expires_at > now,
+            StockReservation.cart_token != cart_token,
+        )
+        .scalar_subquery()
+    )
+
+
+def reserve(cart_token, product_id, quantity):
+    """
+    Створює або оновлює резерв кошика на товар і продовжує його TTL.
+    Перевірка залишку і запис — один умовний INSERT ... SELECT ... ON CONFLICT,
+    тож два одночасні запити не можуть зарезервувати більше, ніж є на складі.
+    Повертає False, якщо вільного залишку не вистачає.
+    """
+    now = datetime.now()
+    expires_at = now + timedelta(seconds=_ttl())
+
+    stmt = insert(StockReservation).from_select(
+        ["cart_token", "product_id", "quantity", "expires_at"],
+        select(
+            literal(cart_token, StockReservation.cart_token.type),
+            Product.id,
+            literal(quantity, StockReservation.quantity.type),
+            literal(expires_at, StockReservation.expires_at.type),
+        ).where(
+            Product.id == product_id,
+            Product.stock - _reserved_by_others(cart_token, now) >= quantity,
+        ),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["cart_token", "product_id"],
+        set_={"quantity": stmt.excluded.quantity, "expires_at": stmt.excluded.expires_at},
+    )
+    result = db.session.execute(stmt)
+    db.session.commit()
+    return result.rowcount > 0
+
+
+def release(cart_token):
+    """Знімає всі резерви кошика (очищення кошика або успішне замовлення)."""
+    StockReservation.query.filter_by(cart_token=cart_token).delete(synchronize_session=False)
+    db.session.commit()
+
+
+def commit_stock(cart_token, items):
+    """
+    Списує товари зі складу одним умовним UPDATE на всю партію:
+        UPDATE product SET stock = stock - ?
+        WHERE id IN (...) AND stock - <активні резерви інших кошиків> >= ?
+    Тобто кошик з простроченим резервом не може забрати товар,
+    уже обіцяний іншому кошику.
+    items — словник {product_id: quantity}.
+    Якщо хоча б одного товару не вистачає, оновлених рядків буде менше — тоді
+    повертаємо False, а транзакцію має відкотити той, хто викликав.
+    Резерви самого кошика знімаються в тій самій транзакції, щоб інші checkout'и
+    не рахували одні й ті самі одиниці двічі (і списаними, і зарезервованими).
+    Коміт не робиться, щоб списання і створення замовлення були в одній транзакції.
+    """
+    if not items:
+        return True
+
+    qty = case(items, value=Product.id)
+    result = db.session.execute(
+        update(Product)
+        .where(
+            Product.id.in_(list(items)),
+            Product.stock - _reserved_by_others(cart_token, datetime.now()) >= qty,
+        )
+        .values(stock=Product.stock - qty)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != len(items):
+        return False
+
+    StockReservation.query.filter_by(cart_token=cart_token).delete(synchronize_session=False)
+    return True
+
+
+def release_expired():
+    """Видаляє прострочені резерви — товар знову стає доступним для інших."""
+    deleted = StockReservation.query.filter(StockReservation.expires_at <= datetime.now()).delete(
+        synchronize_session=False
+    )
+    db.session.commit()
+    return deleted
+
+
+def start_reservation_sweeper(app, interval=60):
+    """Запускає фоновий потік, який періодично повертає прострочені резерви."""
+    def sweep():
+        while True:
+            time.sleep(interval)
+            with app.app_context():
+                try:
+                    release_expired()
+                except Exception:
+                    db.session.rollback()
+
+    thread = threading.Thread(target=sweep, name="reservation-sweeper", daemon=True)
+    thread.start()
+    return thread
@@ -8,6 +8,7 @@ class Product(db.Model):
     price = db.Column(db.Float, nullable=False)
     image_url = db.Column(db.String(250))
     description = db.Column(db.Text)  # поле для опису товару
+    stock = db.Column(db.Integer, nullable=False, default=0)  # залишок на складі
 
     # 🔹 зв'язок з відгуками
     feedbacks = db.relationship("Feedback", back_populates="product", cascade="all, delete-orphan")
@@ -74,3 +75,21 @@ class OrderItem(db.Model):
 
     def __repr__(self):
         return f"{self.product.name} x{self.quantity}"
+
+
+class StockReservation(db.Model):
+    __tablename__ = "stock_reservation"
+    id = db.Column(db.Integer, primary_key=True)
+
+    # 🔹 ключ кошика з сесії (session["cart_token"])
+    cart_token = db.Column(db.String(64), nullable=False, index=True)
+    product_id = db.Column(db.Integer, db.ForeignKey("product.id"), nullable=False, index=True)
+    quantity = db.Column(db.Integer, nullable=False, default=1)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+
+    product = db.relationship("Product")
+
+    __table_args__ = (db.UniqueConstraint("cart_token", "product_id"),)
+
+    def __repr__(self):
+        return f"Резерв {self.product_id} x{self.quantity} до {self.expires_at}"
@@ -1,5 +1,5 @@
 from flask import Blueprint, render_template, redirect, url_for, request
-from models import db, Feedback, Order
+from models import db, Feedback, Order, Product
 
 admin_bp = Blueprint("admin", __name__, url_prefix="/admin")
 
@@ -8,7 +8,8 @@ admin_bp = Blueprint("admin", __name__, url_prefix="/admin")
 def admin_panel():
     orders = Order.query.all()
     feedback = Feedback.query.all()
-    return render_template("admin.html", orders=orders, feedback=feedback)
+    products = Product.query.all()
+    return render_template("admin.html", orders=orders, feedback=feedback, products=products)
 
 # 🔹 Видалення відгуку
 @admin_bp.route("/delete_feedback/<int:id>", methods=["POST"])
@@ -33,6 +34,17 @@ def update_order(order_id):
     db.session.commit()
     return redirect(url_for("admin.admin_panel"))
 
+# 🔹 Оновлення залишку товару на складі
+@admin_bp.route("/update_stock/<int:product_id>", methods=["POST"])
+def update_stock(product_id):
+    product = Product.query.get_or_404(product_id)
+    try:
+        product.stock = max(int(request.form["stock"]), 0)
+    except (KeyError, ValueError):
+        return redirect(url_for("admin.admin_panel"))
+    db.session.commit()
+    return redirect(url_for("admin.admin_panel"))
+
 # 🔹 Видалення замовлення
 @admin_bp.route("/delete_order/<int:order_id>", methods=["POST"])
 def delete_order_route(order_id):
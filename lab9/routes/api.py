@@ -22,6 +22,8 @@ def get_products():
                 type: string
               price:
                 type: number
+              stock:
+                type: integer
     """
     products = Product.query.all()
 
@@ -38,7 +40,8 @@ def get_products():
         "id": p.id,
         "name": p.name,
         "price": p.price,
-        "image_url": img_url_for(p)
+        "image_url": img_url_for(p),
+        "stock": p.stock
     } for p in products])
 
 # 🔹 Створити замовлення (спрощено: створюємо порожнє замовлення для client_id, деталізація через items окремо)
@@ -1,9 +1,17 @@
 from flask import Blueprint, jsonify, render_template, request, redirect, url_for, session
 from datetime import datetime
+from uuid import uuid4
 from models import Feedback, db, Order, Product, Client, OrderItem
+import inventory
 
 shop_bp = Blueprint("shop", __name__)
 
+# 🔹 Ключ кошика для резервів товару
+def cart_token():
+    if "cart_token" not in session:
+        session["cart_token"] = uuid4().hex
+    return session["cart_token"]
+
 # 🔹 Кошик
 @shop_bp.route("/cart")
 def view_cart():
@@ -58,7 +66,8 @@ def api_products():
                 "id": p.id,
                 "name": p.name,
                 "price": p.price,
-                "image_url": p.image_url
+                "image_url": p.image_url,
+                "stock": p.stock
             } for p in products
         ]
     })
@@ -67,6 +76,7 @@ def api_products():
 @shop_bp.route("/clear_cart", methods=["POST"])
 def clear_cart():
     session["cart"] = []
+    inventory.release(cart_token())
     return redirect(url_for("shop.view_cart"))
 
 # 🔹 Додати товар у кошик
@@ -76,9 +86,15 @@ def add_to_cart(product_id):
     cart = session.get("cart", [])
 
     # перевірка на дублікати
+    quantity = next((item["quantity"] for item in cart if item["id"] == product.id), 0) + 1
+
+    # резервуємо товар за кошиком на короткий час
+    if not inventory.reserve(cart_token(), product.id, quantity):
+        return redirect(url_for("shop.shop", out_of_stock=product.id))
+
     for item in cart:
         if item["id"] == product.id:
-            item["quantity"] += 1
+            item["quantity"] = quantity
             break
     else:
         cart.append({
@@ -114,7 +130,8 @@ def shop():
             pass
 
     products = products_query.all()
-    return render_template("shop.html", products=products)
+    out_of_stock = request.args.get("out_of_stock", type=int)
+    return render_template("shop.html", products=products, out_of_stock=out_of_stock)
 
 # 🔹 Деталі продукту
 @shop_bp.route("/product/<int:product_id>")
@@ -177,11 +194,18 @@ def checkout():
         )
 
         # Товари у замовленні
+        items = {}
         for item in cart:
             product = Product.query.get(item["id"])
             if product:
                 order_item = OrderItem(product=product, quantity=item.get("quantity", 1))
                 order.items.append(order_item)
+                items[product.id] = items.get(product.id, 0) + order_item.quantity
+
+        # Списання зі складу: один умовний UPDATE на весь кошик
+        if not inventory.commit_stock(cart_token(), items):
+            db.session.rollback()
+            return render_template("checkout.html", error="На жаль, частини товарів уже немає в наявності")
 
         db.session.add(order)
         db.session.commit()
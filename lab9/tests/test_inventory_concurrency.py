@@ -0,0 +1,107 @@
+import threading
+import time
+
+from models import db, Order, Product, StockReservation
+
+CLIENTS = 200
+STOCK = 3
+
+
+def add_product(app, stock=STOCK):
+    with app.app_context():
+        product = Product(name="Apple", price=240, image_url="images/apple.jpg", stock=stock)
+        db.session.add(product)
+        db.session.commit()
+        return product.id
+
+
+def run_concurrently(clients, action):
+    """Запускає action(client) в окремому потоці для кожного клієнта одночасно."""
+    barrier = threading.Barrier(len(clients))
+    results = [None] * len(clients)
+    errors = []
+
+    def worker(i, client):
+        barrier.wait()
+        try:
+            results[i] = action(client)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i, c)) for i, c in enumerate(clients)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    assert not errors, errors
+    return results, elapsed
+
+
+def checkout(client):
+    return client.post("/checkout", data={
+        "name": "Тест",
+        "email": f"{id(client)}@example.com",
+        "phone": "0000000000",
+        "address": "Київ",
+    })
+
+
+def report(label, count, elapsed):
+    print(f"\n{label}: {count} запитів за {elapsed:.2f} с ({count / elapsed:.0f} req/s)")
+
+
+def test_concurrent_reservations_never_exceed_stock(app):
+    product_id = add_product(app)
+    clients = [app.test_client() for _ in range(CLIENTS)]
+
+    responses, elapsed = run_concurrently(clients, lambda c: c.post(f"/add_to_cart/{product_id}"))
+    report("add_to_cart", len(clients), elapsed)
+
+    reserved = [c for c, r in zip(clients, responses) if "out_of_stock" not in r.location]
+    assert len(reserved) == STOCK
+
+    with app.app_context():
+        assert db.session.query(db.func.sum(StockReservation.quantity)).scalar() == STOCK
+
+    responses, elapsed = run_concurrently(reserved, checkout)
+    report("checkout (з резервом)", len(reserved), elapsed)
+    assert all(r.status_code == 302 for r in responses)
+
+    with app.app_context():
+        assert Order.query.count() == STOCK
+        assert db.session.get(Product, product_id).stock == 0
+        assert StockReservation.query.count() == 0
+
+
+def test_concurrent_checkouts_never_oversell(app):
+    product_id = add_product(app)
+    clients = [app.test_client() for _ in range(CLIENTS)]
+    for client in clients:
+        with client.session_transaction() as session:
+            session["cart"] = [{"id": product_id, "name": "Apple", "price": 240, "quantity": 1}]
+
+    responses, elapsed = run_concurrently(clients, checkout)
+    report("checkout (кошик без резерву)", len(clients), elapsed)
+
+    assert sum(r.status_code == 302 for r in responses) == STOCK
+    with app.app_context():
+        assert Order.query.count() == STOCK
+        assert db.session.get(Product, product_id).stock == 0
+
+
+def test_expired_cart_cannot_take_reserved_stock(app):
+    product_id = add_product(app, stock=1)
+    holder, late = app.test_client(), app.test_client()
+
+    with late.session_transaction() as session:
+        session["cart"] = [{"id": product_id, "name": "Apple", "price": 240, "quantity": 1}]
+    assert "out_of_stock" not in holder.post(f"/add_to_cart/{product_id}").location
+
+    # кошик без дійсного резерву не забирає товар, обіцяний іншому
+    assert checkout(late).status_code == 200
+    assert checkout(holder).status_code == 302
+    with app.app_context():
+        assert db.session.get(Product, product_id).stock == 0